@@ -3,20 +3,24 @@ Complete Usage Example
 Demonstrates how to use the Resume Parser API
 """
 
-import requests
+import asyncio
+import httpx
 import json
-import time
+import mmap
 from pathlib import Path
 
 
 # API Base URL
 BASE_URL = "http://localhost:8000/api/v1"
 
+# Connection pool limits for the shared HTTP/2 client
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
 
-def check_health():
+
+async def check_health(client):
     """Check if the API is healthy"""
     print("🔍 Checking API health...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = await client.get("/health")
     
     if response.status_code == 200:
         data = response.json()
@@ -28,26 +32,25 @@ def check_health():
         return False
 
 
-def upload_resume(file_path, options=None):
+async def upload_resume(client, file_path, options=None):
     """Upload and parse a resume"""
     print(f"\n📤 Uploading resume: {file_path}")
     
-    # Prepare file
-    files = {
-        'file': (Path(file_path).name, open(file_path, 'rb'))
-    }
-    
     # Prepare options
     data = {}
     if options:
         data['options'] = json.dumps(options)
     
-    # Upload
-    response = requests.post(
-        f"{BASE_URL}/resumes/upload",
-        files=files,
-        data=data
-    )
+    # Upload straight from a read-only memory map of the file (closed afterwards)
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        files = {
+            'file': (Path(file_path).name, mm, 'application/octet-stream')
+        }
+        response = await client.post(
+            "/resumes/upload",
+            files=files,
+            data=data
+        )
     
     if response.status_code in [200, 202]:
         result = response.json()
@@ -62,13 +65,42 @@ def upload_resume(file_path, options=None):
         return None
 
 
-def get_resume_data(resume_id, max_wait=30):
+async def wait_for_completion(client, resume_id, max_wait=30):
+    """
+    Wait for processing to finish using the server-sent event stream.
+    Returns the final status, or None if the stream is unavailable.
+    """
+    try:
+        async with client.stream(
+            "GET",
+            f"/resumes/{resume_id}/events",
+            timeout=max_wait
+        ) as response:
+            if response.status_code != 200:
+                return None
+            
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[len("data:"):])
+                if event.get("status") != "processing":
+                    return event.get("status")
+    except httpx.HTTPError:
+        return None
+    
+    return None
+
+
+async def get_resume_data(client, resume_id, max_wait=30):
     """Get parsed resume data (with polling if still processing)"""
     print(f"\n📥 Retrieving resume data...")
     
+    # Block on the event stream first; polling below is only a fallback
+    await wait_for_completion(client, resume_id, max_wait)
+    
     waited = 0
     while waited < max_wait:
-        response = requests.get(f"{BASE_URL}/resumes/{resume_id}")
+        response = await client.get(f"/resumes/{resume_id}")
         
         if response.status_code == 200:
             data = response.json()
@@ -109,7 +141,7 @@ def get_resume_data(resume_id, max_wait=30):
             
         elif response.status_code == 202:
             print("⏳ Still processing... waiting 2 seconds")
-            time.sleep(2)
+            await asyncio.sleep(2)
             waited += 2
         else:
             print(f"❌ Failed to retrieve data: {response.status_code}")
@@ -119,12 +151,12 @@ def get_resume_data(resume_id, max_wait=30):
     return None
 
 
-def match_with_job(resume_id, job_description):
+async def match_with_job(client, resume_id, job_description):
     """Match resume with a job description"""
     print(f"\n🎯 Matching resume with job: {job_description['jobDescription']['title']}")
     
-    response = requests.post(
-        f"{BASE_URL}/resumes/{resume_id}/match",
+    response = await client.post(
+        f"/resumes/{resume_id}/match",
         json=job_description
     )
     
@@ -162,11 +194,11 @@ def match_with_job(resume_id, job_description):
         return None
 
 
-def get_analytics(resume_id):
+async def get_analytics(client, resume_id):
     """Get resume analytics"""
     print(f"\n📈 Fetching analytics...")
     
-    response = requests.get(f"{BASE_URL}/analytics/resume/{resume_id}")
+    response = await client.get(f"/analytics/resume/{resume_id}")
     
     if response.status_code == 200:
         analytics = response.json()
@@ -191,14 +223,25 @@ def get_analytics(resume_id):
         return None
 
 
-def main():
+async def main():
     """Main example workflow"""
     print("=" * 60)
     print("AI-Powered Resume Parser - Usage Example")
     print("=" * 60)
     
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=True,
+        timeout=30.0,
+        limits=CLIENT_LIMITS
+    ) as client:
+        await run_workflow(client)
+
+
+async def run_workflow(client):
+    """Run the example steps against a shared client"""
     # Step 1: Check health
-    if not check_health():
+    if not await check_health(client):
         print("\n⚠️  API is not available. Please start the server.")
         return
     
@@ -264,21 +307,18 @@ Certified Kubernetes Administrator (CKA) | CNCF | 2021
         'performOCR': False
     }
     
-    resume_id = upload_resume(resume_file, options)
+    resume_id = await upload_resume(client, resume_file, options)
     
     if not resume_id:
         return
     
     # Step 3: Get resume data
-    resume_data = get_resume_data(resume_id)
+    resume_data = await get_resume_data(client, resume_id)
     
     if not resume_data:
         return
     
-    # Step 4: Get analytics
-    analytics = get_analytics(resume_id)
-    
-    # Step 5: Match with job
+    # Step 4 & 5: Get analytics and match with job (independent, run concurrently)
     job_description = {
         "jobDescription": {
             "title": "Senior Software Engineer",
@@ -316,7 +356,10 @@ Certified Kubernetes Administrator (CKA) | CNCF | 2021
         }
     }
     
-    matching_result = match_with_job(resume_id, job_description)
+    analytics, matching_result = await asyncio.gather(
+        get_analytics(client, resume_id),
+        match_with_job(client, resume_id, job_description)
+    )
     
     print("\n" + "=" * 60)
     print("✅ Example completed successfully!")
@@ -329,4 +372,4 @@ Certified Kubernetes Administrator (CKA) | CNCF | 2021
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
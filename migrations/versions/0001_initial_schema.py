@@ -0,0 +1,22 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Baseline revision: no ORM models are declared on Base yet, so there is
+    # nothing to create. Later revisions add tables with explicit op calls
+    # rather than create_all, which would drift as models change.
+    pass
+
+
+def downgrade():
+    pass
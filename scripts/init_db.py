@@ -0,0 +1,26 @@
+"""
+Database initialization
+Applies all Alembic migrations once, before the API workers start:
+
+    python scripts/init_db.py
+"""
+
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+
+def main():
+    """Upgrade the database schema to the latest revision"""
+    config = Config(str(ROOT_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,46 @@ Health check endpoint
 """
 
 from fastapi import APIRouter
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional, Tuple
 import time
 from loguru import logger
+from sqlalchemy import text
 
 from src.config import settings
+from src.database import engine
 
 
 router = APIRouter()
 
-# Track startup time
-startup_time = time.time()
+# Track startup time (monotonic: cheap and immune to wall-clock jumps)
+startup_time = time.monotonic()
+
+_now = datetime.now
+
+# Last database probe as (timestamp, status); re-probed at most every DB_CHECK_TTL seconds
+DB_CHECK_TTL = 5
+_last_check: Optional[Tuple[float, str]] = None
+
+
+def _check_database() -> str:
+    """Return the database status, reusing a recent probe result"""
+    global _last_check
+
+    now = time.monotonic()
+    if _last_check is not None and now - _last_check[0] <= DB_CHECK_TTL:
+        return _last_check[1]
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        database_status = "connected"
+    except Exception as e:
+        logger.warning(f"Database health check failed: {e}")
+        database_status = "error"
+
+    _last_check = (now, database_status)
+    return database_status
 
 
 @router.get("/health")
@@ -23,25 +52,17 @@ async def health_check():
     Returns service health status and basic information
     """
     try:
-        uptime = int(time.time() - startup_time)
+        uptime = int(time.monotonic() - startup_time)
         
         # Check database connection (if configured)
-        database_status = "not_configured"
-        try:
-            from src.database import engine
-            with engine.connect() as conn:
-                conn.execute("SELECT 1")
-            database_status = "connected"
-        except Exception as e:
-            logger.warning(f"Database health check failed: {e}")
-            database_status = "error"
+        database_status = _check_database()
         
         # Check AI service
         ai_status = "operational" if settings.OPENAI_API_KEY and settings.OPENAI_API_KEY != "your-openai-key-here" else "not_configured"
         
         return {
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(timezone.utc).isoformat(timespec="seconds"),
             "version": settings.API_VERSION,
             "uptime": uptime,
             "services": {
@@ -56,6 +77,6 @@ async def health_check():
         logger.error(f"Health check failed: {e}")
         return {
             "status": "unhealthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(timezone.utc).isoformat(timespec="seconds"),
             "error": str(e)
         }
\ No newline at end of file
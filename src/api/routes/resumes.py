@@ -4,19 +4,28 @@ Resume processing API endpoints
 Handles resume upload, parsing, retrieval, update, and deletion
 """
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, Form
-from fastapi.responses import JSONResponse
-from typing import Optional, Dict, Any
+from fastapi import APIRouter, BackgroundTasks, Depends, File, UploadFile, HTTPException, Form, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse, Response
+from typing import Optional, Dict, Any, BinaryIO, List, NamedTuple, Tuple, Union, get_origin
+import asyncio
+import copy
+import hashlib
+import os
+import tempfile
+import threading
 import uuid
 from datetime import datetime
 from loguru import logger
-import json
+import orjson
+from cachetools import TTLCache
+from pydantic import BaseModel, ValidationError
 
-from src.services.parser_service import parser_service
+from src.services.parser_service import ParserService, get_parser_service
 from src.utils.validators import (
     validate_file_size,
     validate_file_extension,
     sanitize_filename,
+    validators_cache_info,
     Resume  # ✅ schema imported
 )
 from src.config import settings
@@ -24,171 +33,272 @@ from src.config import settings
 router = APIRouter()
 
 # Temporary in-memory storage (replace with DB later)
-resumes_db: Dict[str, Dict[str, Any]] = {}
-
-
-# @router.post("/resumes/upload")
-# async def upload_resume(
-#     file: UploadFile = File(...),
-#     options: Optional[str] = Form(None)
-# ):
-#     """
-#     Upload and parse a resume file.
-#     Supports multiple formats: PDF, DOCX, DOC, TXT, JPG, PNG.
-#     """
-#     try:
-#         if not file:
-#             raise HTTPException(status_code=400, detail="No file provided")
-
-#         # Read file content
-#         file_content = await file.read()
-
-#         # ✅ Validate file size
-#         if not validate_file_size(len(file_content), settings.MAX_FILE_SIZE):
-#             raise HTTPException(
-#                 status_code=413,
-#                 detail={
-#                     "error": "FILE_TOO_LARGE",
-#                     "message": f"File exceeds limit ({settings.MAX_FILE_SIZE / 1024 / 1024} MB)"
-#                 }
-#             )
-
-#         # ✅ Validate file extension
-#         if not validate_file_extension(file.filename, settings.ALLOWED_EXTENSIONS):
-#             raise HTTPException(
-#                 status_code=415,
-#                 detail={
-#                     "error": "UNSUPPORTED_FORMAT",
-#                     "message": "File format not supported",
-#                     "details": {
-#                         "supportedFormats": settings.ALLOWED_EXTENSIONS,
-#                         "receivedFormat": file.filename.split('.')[-1]
-#                     }
-#                 }
-#             )
-
-#         # ✅ Sanitize filename
-#         safe_filename = sanitize_filename(file.filename)
-
-#         # ✅ Parse JSON options safely
-#         parsing_options = {}
-#         if options:
-#             try:
-#                 parsing_options = json.loads(options)
-#             except json.JSONDecodeError:
-#                 logger.warning(f"Invalid JSON in options: {options}")
-
-#         # ✅ Generate unique resume ID
-#         resume_id = str(uuid.uuid4())
-#         logger.info(f"Processing resume upload: {safe_filename} (ID: {resume_id})")
-
-#         # ✅ Parse resume (core logic)
-#         parsed_data = await parser_service.parse_resume(file_content, safe_filename, parsing_options)
-
-#         # ✅ Validate parsed data against Resume schema to avoid 422
-#         try:
-#             resume_valid = Resume(**parsed_data).dict()
-#         except Exception as e:
-#             logger.error(f"Resume validation failed: {e}")
-#             raise HTTPException(status_code=422, detail=str(e))
-
-#         # ✅ Store validated data in memory
-#         resumes_db[resume_id] = {
-#             "id": resume_id,
-#             "status": "completed",
-#             "data": resume_valid,
-#             "uploadedAt": datetime.now().isoformat()
-#         }
-
-#         return JSONResponse(
-#             status_code=202,
-#             content={
-#                 "id": resume_id,
-#                 "status": "completed",
-#                 "message": "Resume uploaded and parsed successfully",
-#                 "estimatedProcessingTime": 30,
-#                 "webhookUrl": None
-#             }
-#         )
-
-#     except HTTPException:
-#         raise
-#     except Exception as e:
-#         logger.error(f"Upload failed: {e}")
-#         raise HTTPException(status_code=500, detail=str(e))
+# Bounded and expiring so long-running servers don't grow without limit
+RESUMES_DB_MAXSIZE = 10_000
+resumes_db: TTLCache = TTLCache(maxsize=RESUMES_DB_MAXSIZE, ttl=settings.CACHE_TTL)
+resumes_db_lock = threading.Lock()
+
+# Validated parse results keyed by content digest, so identical uploads skip parsing
+PARSE_CACHE_MAXSIZE = 5000
+PARSE_CACHE_TTL = 4 * 3600
+parse_cache: TTLCache = TTLCache(maxsize=PARSE_CACHE_MAXSIZE, ttl=PARSE_CACHE_TTL)
+parse_cache_lock = threading.Lock()
+
+# Top-level Resume fields holding objects; PUT merges these instead of replacing them
+_DICT_FIELDS = frozenset(
+    name for name, field in Resume.model_fields.items()
+    if (isinstance(field.annotation, type) and issubclass(field.annotation, BaseModel))
+    or get_origin(field.annotation) is dict
+)
 
-@router.post("/resumes/upload")
-async def upload_resume(
-    file: UploadFile = File(...),
-    options: Optional[str] = Form(None)
-):
-    """
-    Upload and parse a resume file.
-    Supports multiple formats: PDF, DOCX, DOC, TXT, JPG, PNG.
-    """
-    try:
-        if not file:
-            raise HTTPException(status_code=400, detail="No file provided")
+# Wake-ups for open event streams, keyed by resume ID; set when parsing ends.
+# Only touched from the event loop, so no lock is needed
+_status_events: Dict[str, asyncio.Event] = {}
 
-        file_content = await file.read()
+# How often an idle event stream sends a keep-alive comment (seconds)
+EVENT_KEEPALIVE_INTERVAL = 15
 
-        if not validate_file_size(len(file_content), settings.MAX_FILE_SIZE):
-            raise HTTPException(
-                status_code=413,
-                detail={
-                    "error": "FILE_TOO_LARGE",
-                    "message": f"File exceeds limit ({settings.MAX_FILE_SIZE / 1024 / 1024} MB)"
-                }
-            )
 
-        if not validate_file_extension(file.filename, settings.ALLOWED_EXTENSIONS):
-            raise HTTPException(
-                status_code=415,
-                detail={
-                    "error": "UNSUPPORTED_FORMAT",
-                    "message": "File format not supported",
-                    "details": {
-                        "supportedFormats": settings.ALLOWED_EXTENSIONS,
-                        "receivedFormat": file.filename.split('.')[-1]
-                    }
-                }
-            )
+# Uploads are streamed in chunks into a spooled temp file that rolls to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_SPOOL_MAX_MEMORY = 1024 * 1024
 
-        safe_filename = sanitize_filename(file.filename)
+# Allowance for multipart framing when pre-checking the Content-Length header
+MULTIPART_OVERHEAD = 64 * 1024
 
-        parsing_options = {}
-        if options:
-            try:
-                parsing_options = json.loads(options)
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON in options: {options}")
+# Most files accepted by one /resumes/bulk or /resumes/batch request
+MAX_BATCH_FILES = 20
+
+
+class _ParseJob(NamedTuple):
+    """A registered upload whose parse must still run"""
+    resume_id: str
+    spooled: BinaryIO
+    filename: str
+    options: Dict[str, Any]
+    digest: str
+    file_hash: str
+
+
+def _file_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail={
+            "error": "FILE_TOO_LARGE",
+            "message": f"File exceeds limit ({settings.MAX_FILE_SIZE / 1024 / 1024} MB)"
+        }
+    )
+
+
+def _check_file_count(files: List[UploadFile]) -> None:
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "error": "TOO_MANY_FILES",
+                "message": f"A request may contain at most {MAX_BATCH_FILES} files",
+                "details": {"received": len(files)}
+            }
+        )
+
+
+async def _spool_upload(file: UploadFile, spooled: BinaryIO) -> str:
+    """
+    Stream an upload into `spooled`, validating its size and extension.
+    Returns the SHA-256 hex digest of the content; raises HTTPException on invalid input.
+    """
+    # Stream the upload: hash and size it without holding it all in memory
+    content_hash = hashlib.sha256()
+    file_size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        file_size += len(chunk)
+        if not validate_file_size(file_size, settings.MAX_FILE_SIZE):
+            raise _file_too_large()
+        content_hash.update(chunk)
+        spooled.write(chunk)
+    spooled.seek(0)
+
+    suffix = os.path.splitext(file.filename)[1][1:].lower()
+    if not validate_file_extension(suffix, settings.ALLOWED_EXTENSIONS):
+        raise HTTPException(
+            status_code=415,
+            detail={
+                "error": "UNSUPPORTED_FORMAT",
+                "message": "File format not supported",
+                "details": {
+                    "supportedFormats": sorted(settings.ALLOWED_EXTENSIONS),
+                    "receivedFormat": suffix
+                }
+            }
+        )
 
-        resume_id = str(uuid.uuid4())
-        logger.info(f"Processing resume upload: {safe_filename} (ID: {resume_id})")
+    return content_hash.hexdigest()
 
-        # ✅ FIX: Await the async function
-        parsed_data = await parser_service.parse_resume(file_content, safe_filename, parsing_options)
 
-        # ✅ Validate the parsed data
+def _parse_options(options: Optional[str]) -> Dict[str, Any]:
+    """Decode the JSON parsing options form field, ignoring invalid input"""
+    parsing_options = {}
+    if options:
         try:
-            resume_valid = Resume(**parsed_data).dict()
-        except Exception as e:
-            logger.error(f"Resume validation failed: {e}")
-            raise HTTPException(status_code=422, detail=str(e))
+            parsing_options = orjson.loads(options)
+        except orjson.JSONDecodeError:
+            logger.warning("Invalid JSON in options: {}", options)
+    return parsing_options
+
+
+def _register_upload(
+    spooled: BinaryIO,
+    file_hash: str,
+    filename: str,
+    parsing_options: Dict[str, Any]
+) -> Tuple[str, Optional[_ParseJob]]:
+    """
+    Store a new resume entry for an accepted upload.
+    Returns the resume ID and, unless the parse cache already had the result,
+    the `_do_parse` job that must still run.
+    """
+    resume_id = str(uuid.uuid4())
+    logger.info("Processing resume upload: {} (ID: {})", filename, resume_id)
+
+    # Options change the parse output, so they are part of the cache key
+    key_hash = hashlib.blake2b(file_hash.encode(), digest_size=16)
+    key_hash.update(orjson.dumps(parsing_options, option=orjson.OPT_SORT_KEYS))
+    digest = key_hash.hexdigest()
+
+    uploaded_at = datetime.now().isoformat()
+    cached = parse_cache.get(digest)
+    if cached is not None:
+        logger.info("Parse cache hit for {} ({})", filename, digest)
+        with resumes_db_lock:
+            resumes_db[resume_id] = {
+                "id": resume_id,
+                "status": "completed",
+                "data": copy.deepcopy(cached),
+                "uploadedAt": uploaded_at,
+                "completedAt": uploaded_at
+            }
+        return resume_id, None
 
+    with resumes_db_lock:
         resumes_db[resume_id] = {
             "id": resume_id,
-            "status": "completed",
-            "data": resume_valid,
-            "uploadedAt": datetime.now().isoformat()
+            "status": "processing",
+            "uploadedAt": uploaded_at
         }
+    return resume_id, _ParseJob(resume_id, spooled, filename, parsing_options, digest, file_hash)
+
+
+async def _do_parse(parser: ParserService, job: _ParseJob) -> None:
+    """Parse an uploaded resume in the background and record the outcome"""
+    try:
+        outcome = await parser.parse_resume(
+            job.spooled, job.filename, job.options, precomputed_hash=job.file_hash
+        )
+    except Exception as e:
+        outcome = e
+    finally:
+        job.spooled.close()
+
+    _record_outcome(job.resume_id, job.digest, outcome)
+
+
+def _record_outcome(
+    resume_id: str,
+    digest: str,
+    outcome: Union[Dict[str, Any], Exception]
+) -> Dict[str, Any]:
+    """Validate a parse outcome, cache it, and store it on the resume entry"""
+    try:
+        if isinstance(outcome, Exception):
+            raise outcome
+        resume_valid = Resume.model_validate(outcome).model_dump(mode="json")
+
+        with parse_cache_lock:
+            parse_cache[digest] = copy.deepcopy(resume_valid)
 
-        return JSONResponse(
+        result = {"status": "completed", "data": resume_valid}
+    except Exception as e:
+        logger.error("Parsing failed for resume {}: {}", resume_id, e)
+        result = {"status": "failed", "error": str(e)}
+
+    with resumes_db_lock:
+        # The resume may have been deleted while it was being parsed
+        if resume_id in resumes_db:
+            resumes_db[resume_id].update(result, completedAt=datetime.now().isoformat())
+    _notify_status_change(resume_id)
+    return result
+
+
+def _fail_pending(resume_ids: List[str], error: Exception) -> None:
+    """Mark registered entries that never got a parse outcome as failed"""
+    failed_at = datetime.now().isoformat()
+    with resumes_db_lock:
+        for resume_id in resume_ids:
+            resume = resumes_db.get(resume_id)
+            if resume is not None and resume["status"] == "processing":
+                resume.update(status="failed", error=str(error), completedAt=failed_at)
+    for resume_id in resume_ids:
+        _notify_status_change(resume_id)
+
+
+def _notify_status_change(resume_id: str) -> None:
+    """Wake the event streams waiting on a resume"""
+    event = _status_events.pop(resume_id, None)
+    if event is not None:
+        event.set()
+
+
+async def _do_parse_many(parser: ParserService, jobs: List[_ParseJob]) -> None:
+    """Run several background parse jobs concurrently"""
+    await asyncio.gather(*(_do_parse(parser, job) for job in jobs))
+
+
+def _compute_etag(data: Dict[str, Any]) -> str:
+    """Build a strong ETag from the canonical JSON form of resume data"""
+    digest = hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f'"{digest}"'
+
+
+@router.post("/resumes/upload")
+async def upload_resume(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    options: Optional[str] = Form(None),
+    parser: ParserService = Depends(get_parser_service)
+):
+    """
+    Upload and parse a resume file.
+    Supports multiple formats: PDF, DOCX, DOC, TXT, JPG, PNG.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY)
+    try:
+        if not file:
+            raise HTTPException(status_code=400, detail="No file provided")
+
+        content_length = int(request.headers.get("content-length") or 0)
+        if content_length > settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD:
+            raise _file_too_large()
+
+        file_hash = await _spool_upload(file, spooled)
+        safe_filename = sanitize_filename(file.filename)
+        parsing_options = _parse_options(options)
+
+        resume_id, job = _register_upload(spooled, file_hash, safe_filename, parsing_options)
+        if job is not None:
+            # Parsing (OCR + model inference) runs after the response is sent
+            background_tasks.add_task(_do_parse, parser, job)
+            spooled = None  # ownership passes to the background task
+            status, message = "processing", "Resume uploaded; parsing started"
+        else:
+            status, message = "completed", "Resume uploaded and parsed successfully"
+
+        return ORJSONResponse(
             status_code=202,
             content={
                 "id": resume_id,
-                "status": "completed",
-                "message": "Resume uploaded and parsed successfully",
+                "status": status,
+                "message": message,
                 "estimatedProcessingTime": 30,
                 "webhookUrl": None
             }
@@ -197,22 +307,177 @@ async def upload_resume(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Upload failed: {e}")
+        logger.error("Upload failed: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if spooled is not None:
+            spooled.close()
 
 
+@router.post("/resumes/bulk")
+async def upload_resumes_bulk(
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(...),
+    options: Optional[str] = Form(None),
+    parser: ParserService = Depends(get_parser_service)
+):
+    """
+    Upload several resume files in one request.
+    Each file is validated independently; accepted files are parsed
+    concurrently in a single background job. At most MAX_BATCH_FILES files.
+    """
+    _check_file_count(files)
+    parsing_options = _parse_options(options)
+    results = []
+    jobs = []
+
+    try:
+        for file in files:
+            spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY)
+            try:
+                file_hash = await _spool_upload(file, spooled)
+                safe_filename = sanitize_filename(file.filename)
+                resume_id, job = _register_upload(spooled, file_hash, safe_filename, parsing_options)
+            except HTTPException as e:
+                spooled.close()
+                results.append({
+                    "fileName": file.filename,
+                    "status": "rejected",
+                    "error": e.detail
+                })
+                continue
+            except Exception:
+                spooled.close()
+                raise
+
+            if job is not None:
+                jobs.append(job)
+                status = "processing"
+            else:
+                spooled.close()
+                status = "completed"
+            results.append({"id": resume_id, "fileName": safe_filename, "status": status})
+    except Exception as e:
+        # The background job will never run: release its spools and
+        # don't leave the already registered entries stuck in "processing"
+        logger.error("Bulk upload failed: {}", e)
+        for job in jobs:
+            job.spooled.close()
+        _fail_pending([job.resume_id for job in jobs], e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if jobs:
+        background_tasks.add_task(_do_parse_many, parser, jobs)
+
+    return ORJSONResponse(status_code=202, content={"results": results})
+
+
+@router.post("/resumes/batch")
+async def parse_resumes_batch(
+    files: List[UploadFile] = File(...),
+    options: Optional[str] = Form(None),
+    parser: ParserService = Depends(get_parser_service)
+):
+    """
+    Parse several resume files within the request and return the results.
+    Text extraction runs concurrently and the files share batched model
+    calls, so setup cost is paid once per batch. At most MAX_BATCH_FILES files.
+    """
+    _check_file_count(files)
+    parsing_options = _parse_options(options)
+    spools = [
+        tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY) for _ in files
+    ]
+    jobs = []
+    try:
+        hashes = await asyncio.gather(
+            *(_spool_upload(file, spooled) for file, spooled in zip(files, spools)),
+            return_exceptions=True
+        )
+
+        results = []
+        for file, spooled, file_hash in zip(files, spools, hashes):
+            if isinstance(file_hash, HTTPException):
+                results.append({
+                    "fileName": file.filename,
+                    "status": "rejected",
+                    "error": file_hash.detail
+                })
+                continue
+            if isinstance(file_hash, Exception):
+                raise file_hash
+
+            safe_filename = sanitize_filename(file.filename)
+            resume_id, job = _register_upload(spooled, file_hash, safe_filename, parsing_options)
+            entry = {"id": resume_id, "fileName": safe_filename}
+            if job is not None:
+                jobs.append((job, entry))
+            else:
+                with resumes_db_lock:
+                    entry.update(status="completed", data=resumes_db[resume_id]["data"])
+            results.append(entry)
+
+        if jobs:
+            outcomes = await parser.parse_batch(
+                [job.spooled for job, _ in jobs],
+                [job.filename for job, _ in jobs],
+                parsing_options,
+                file_hashes=[job.file_hash for job, _ in jobs]
+            )
+            for (job, entry), outcome in zip(jobs, outcomes):
+                entry.update(_record_outcome(job.resume_id, job.digest, outcome))
+
+        return ORJSONResponse(content={"results": results})
+
+    except Exception as e:
+        # The client never sees these IDs; don't leave them stuck in "processing"
+        _fail_pending([job.resume_id for job, _ in jobs], e)
+        if isinstance(e, HTTPException):
+            raise
+        logger.error("Batch parsing failed: {}", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        for spooled in spools:
+            spooled.close()
+
 
 @router.get("/resumes/{id}")
-async def get_resume(id: str):
-    """Retrieve parsed resume data by ID"""
+async def get_resume(id: str, request: Request):
+    """
+    Retrieve parsed resume data by ID.
+    Supports conditional requests: a matching If-None-Match returns 304.
+    """
     try:
         if id not in resumes_db:
             raise HTTPException(status_code=404, detail="Resume not found")
 
         resume = resumes_db[id]
-        return {"id": id, **resume["data"]}
+        if resume["status"] == "processing":
+            return ORJSONResponse(
+                status_code=202,
+                content={"id": id, "status": "processing"}
+            )
+        if resume["status"] == "failed":
+            return ORJSONResponse(
+                status_code=422,
+                content={"id": id, "status": "failed", "error": resume.get("error")}
+            )
+
+        etag = resume.get("etag")
+        if etag is None:
+            etag = resume["etag"] = _compute_etag(resume["data"])
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return ORJSONResponse(
+            content={"id": id, **resume["data"]},
+            headers={"ETag": etag}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error retrieving resume {id}: {e}")
+        logger.error("Error retrieving resume {}: {}", id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -224,21 +489,38 @@ async def update_resume(id: str, update_data: Dict[str, Any]):
             raise HTTPException(status_code=404, detail="Resume not found")
 
         resume = resumes_db[id]
-        data = resume["data"]
+        if resume["status"] != "completed":
+            return ORJSONResponse(
+                status_code=409,
+                content={"id": id, "status": resume["status"], "message": "Resume is not parsed yet"}
+            )
+        data = dict(resume["data"])
 
-        # Merge updates safely
+        # Merge updates: object fields are merged, everything else is replaced
         for key, value in update_data.items():
-            if key in data:
-                if isinstance(data[key], dict) and isinstance(value, dict):
-                    data[key].update(value)
-                else:
-                    data[key] = value
+            if key in _DICT_FIELDS and isinstance(value, dict):
+                data[key] = {**data.get(key, {}), **value}
+            else:
+                data[key] = value
+
+        # Re-validate so unchecked client input never reaches storage
+        try:
+            data = Resume.model_validate(data).model_dump(mode="json")
+        except ValidationError as e:
+            return ORJSONResponse(
+                status_code=422,
+                content={"error": "VALIDATION_ERROR", "message": str(e)}
+            )
 
-        resumes_db[id]["data"] = data
+        with resumes_db_lock:
+            resumes_db[id]["data"] = data
+            resumes_db[id].pop("etag", None)
         return {"id": id, **data}
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error updating resume {id}: {e}")
+        logger.error("Error updating resume {}: {}", id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -249,13 +531,17 @@ async def delete_resume(id: str):
         if id not in resumes_db:
             raise HTTPException(status_code=404, detail="Resume not found")
 
-        del resumes_db[id]
-        logger.info(f"Resume {id} deleted successfully")
+        with resumes_db_lock:
+            resumes_db.pop(id, None)
+        _notify_status_change(id)
+        logger.info("Resume {} deleted successfully", id)
 
-        return JSONResponse(status_code=204, content=None)
+        return ORJSONResponse(status_code=204, content=None)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error deleting resume {id}: {e}")
+        logger.error("Error deleting resume {}: {}", id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -275,10 +561,20 @@ async def get_processing_status(id: str):
                 "status": "completed",
                 "progress": 100,
                 "currentStep": "completed",
-                "completedAt": resume.get("uploadedAt"),
+                "completedAt": resume.get("completedAt", resume.get("uploadedAt")),
                 "processingTime": resume["data"].get("metadata", {}).get("processingTime", 0)
             }
 
+        if status == "failed":
+            return {
+                "id": id,
+                "status": "failed",
+                "progress": 100,
+                "currentStep": "failed",
+                "completedAt": resume.get("completedAt"),
+                "error": resume.get("error")
+            }
+
         return {
             "id": id,
             "status": "processing",
@@ -287,6 +583,64 @@ async def get_processing_status(id: str):
             "estimatedTimeRemaining": 20
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error getting status for resume {id}: {e}")
+        logger.error("Error getting status for resume {}: {}", id, e)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/resumes/{id}/events")
+async def stream_processing_events(id: str):
+    """
+    Stream processing status changes as server-sent events.
+    The stream closes once the resume leaves the "processing" state.
+    """
+    if id not in resumes_db:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    async def event_stream():
+        last_status = None
+        while True:
+            resume = resumes_db.get(id)
+            status = resume["status"] if resume else "deleted"
+
+            if status != last_status:
+                payload = orjson.dumps({"id": id, "status": status}).decode()
+                yield f"event: status\ndata: {payload}\n\n"
+                last_status = status
+
+            if status != "processing":
+                break
+
+            # Sleep until the outcome is recorded; the timeout only keeps proxies from
+            # closing an idle connection (and re-checks entries that expired meanwhile)
+            changed = _status_events.setdefault(id, asyncio.Event())
+            try:
+                await asyncio.wait_for(changed.wait(), EVENT_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Report occupancy of the in-memory resume caches"""
+    return {
+        "resumes": {
+            "size": len(resumes_db),
+            "maxsize": resumes_db.maxsize,
+            "ttl": resumes_db.ttl
+        },
+        "parseCache": {
+            "size": len(parse_cache),
+            "maxsize": parse_cache.maxsize,
+            "ttl": parse_cache.ttl
+        },
+        "validators": validators_cache_info()
+    }
@@ -1,10 +1,15 @@
 # src/config.py
 import os
-import json
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet, List
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+try:
+    import orjson as _json
+except ImportError:  # stdlib fallback keeps settings loadable without orjson
+    import json as _json
+
 
 class Settings(BaseSettings):
     # ==== API Configuration ====
@@ -12,6 +17,9 @@ class Settings(BaseSettings):
     API_VERSION: str = "1.0.0"
     API_HOST: str = "127.0.0.1"
     API_PORT: int = 8000
+    # Resume state and the model live in process memory; keep one worker
+    # until that state moves to a shared store
+    WORKERS: int = 1
     DEBUG: bool = True
     ENVIRONMENT: str = "development"
 
@@ -36,12 +44,13 @@ class Settings(BaseSettings):
 
     # ==== File Upload Settings ====
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5 MB
-    ALLOWED_EXTENSIONS: List[str] = ["pdf", "docx", "doc", "txt", "jpg", "png", "jpeg"]
+    ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({"pdf", "docx", "doc", "txt", "jpg", "png", "jpeg"})
     UPLOAD_DIR: str = "./uploads"
 
     # ==== Processing Options ====
     ENABLE_OCR: bool = True
     ENABLE_AI_ENHANCEMENT: bool = True
+    AI_WARMUP_ON_STARTUP: bool = False
     DEFAULT_LANGUAGE: str = "en"
 
     # ==== Security ====
@@ -76,25 +85,35 @@ class Settings(BaseSettings):
         Supports:
           - Comma-separated strings → "pdf,docx,txt"
           - JSON-style lists → ["pdf","docx","txt"]
+        Always returns a frozenset of lowercase extensions without dots.
         """
         if isinstance(v, str):
             try:
-                parsed = json.loads(v)
+                parsed = _json.loads(v)
                 if isinstance(parsed, list):
-                    return [ext.strip().lower() for ext in parsed]
-            except json.JSONDecodeError:
-                return [ext.strip().lower() for ext in v.split(",") if ext.strip()]
-        return v
+                    v = parsed
+                else:
+                    v = v.split(",")
+            except ValueError:  # both decoders raise JSONDecodeError subclasses of ValueError
+                v = v.split(",")
+        return frozenset(ext.strip().lower().lstrip(".") for ext in v if ext.strip())
 
     class Config:
         env_file = ".env"
         case_sensitive = False
         extra = "ignore"
+        frozen = True
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Build the Settings once per process (reads .env and runs validators)"""
+    return Settings()
 
 
 # ✅ Instantiate Settings
-settings = Settings()
+settings = get_settings()
+
 
-# ✅ Optional Debug Print
-if settings.DEBUG:
+if __name__ == "__main__":
     print("Loaded Allowed Extensions:", settings.ALLOWED_EXTENSIONS)
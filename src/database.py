@@ -2,7 +2,9 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from loguru import logger
@@ -10,21 +12,28 @@ from loguru import logger
 from src.config import settings
 
 
+# SQL echo is opt-in: only at DEBUG log level and never in production
+SQL_ECHO = settings.LOG_LEVEL.upper() == "DEBUG" and settings.ENVIRONMENT != "production"
+
+# Interval (seconds) for the background pool ping that replaces per-checkout pre-ping
+POOL_PING_INTERVAL = 60
+
+
 # Create database engine
 try:
     engine = create_engine(
         settings.DATABASE_URL,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
-        echo=settings.DEBUG
+        pool_size=max(10, (os.cpu_count() or 1) * 2),
+        max_overflow=0,
+        pool_recycle=1800,
+        echo=SQL_ECHO
     )
     logger.info("Database engine created successfully")
 except Exception as e:
     logger.warning(f"Database engine creation failed: {e}")
     logger.info("Application will run in memory-only mode")
     # Create a fallback engine (SQLite in-memory for demo)
-    engine = create_engine("sqlite:///:memory:", echo=settings.DEBUG)
+    engine = create_engine("sqlite:///:memory:", echo=SQL_ECHO)
 
 
 # Create session factory
@@ -56,9 +65,25 @@ def test_connection():
     """Test database connection"""
     try:
         with engine.connect() as connection:
-            connection.execute("SELECT 1")
+            connection.execute(text("SELECT 1"))
         logger.info("Database connection test successful")
         return True
     except Exception as e:
         logger.error(f"Database connection test failed: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+def ping_pool() -> bool:
+    """
+    Ping the database through a pooled connection.
+    On failure the pool is disposed so stale connections are not handed out.
+    """
+    try:
+        with engine.connect() as connection:
+            if not engine.dialect.do_ping(connection.connection.dbapi_connection):
+                raise ConnectionError("Database ping returned false")
+        return True
+    except Exception as e:
+        logger.debug(f"Database pool ping failed, disposing pool: {e}")
+        engine.dispose()
+        return False
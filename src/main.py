@@ -5,19 +5,51 @@ Main FastAPI application entry point
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from contextlib import asynccontextmanager
+import asyncio
 import time
 from loguru import logger
+from alembic.runtime.migration import MigrationContext
 
 from src.config import settings
-from src.database import engine, Base
+from src.database import engine, ping_pool, POOL_PING_INTERVAL
 from src.api.routes import health, resumes, matching, analytics
+from src.services.ai_service import get_ai_service
+from src.utils.pdf_extractor import shutdown_ocr_pool
 
-# Configure logger
-logger.add("logs/api_{time}.log", rotation="500 MB", retention="10 days", level="INFO")
+async def _pool_health_loop():
+    """
+    Periodically ping the DB pool off the event loop.
+    Only changes in reachability are logged, so an absent dev database
+    isn't reported every interval.
+    """
+    healthy = True
+    while True:
+        await asyncio.sleep(POOL_PING_INTERVAL)
+        reachable = await asyncio.to_thread(ping_pool)
+        if reachable != healthy:
+            if reachable:
+                logger.info("Database reachable again")
+            else:
+                logger.warning("Database unreachable; pool pings continue in the background")
+            healthy = reachable
+
+
+# Configure logger (enqueue=True hands records to a background writer thread;
+# serialize=True writes one JSON object per line for downstream parsing)
+logger.add(
+    "logs/api_{time}.log",
+    rotation="500 MB",
+    retention="10 days",
+    level=settings.LOG_LEVEL.upper(),
+    enqueue=True,
+    serialize=True,
+    backtrace=False,
+    diagnose=False
+)
 
 
 @asynccontextmanager
@@ -30,17 +62,36 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"API Version: {settings.API_VERSION}")
     
-    # Create database tables
+    # Verify the database is reachable; schema is managed by `python scripts/init_db.py`
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created/verified successfully")
+        with engine.connect() as conn:
+            revision = MigrationContext.configure(conn).get_current_revision()
+        if revision:
+            logger.info(f"Database connected (schema revision: {revision})")
+        else:
+            logger.warning("Database schema not initialized; run `python scripts/init_db.py`")
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
     
+    # Optionally pay the model load + first-inference cost before serving traffic
+    if settings.AI_WARMUP_ON_STARTUP:
+        logger.info("Warming up AI model...")
+        ai_service = await asyncio.to_thread(get_ai_service)
+        await ai_service.generate_summary("warmup")
+        logger.info("AI model warm-up complete")
+    
+    # Without a configured database the app runs on the in-memory fallback; nothing to ping
+    pool_health_task = None
+    if settings.DATABASE_URL and engine.dialect.name != "sqlite":
+        pool_health_task = asyncio.create_task(_pool_health_loop())
+    
     yield
     
     # Shutdown
     logger.info("Shutting down AI Resume Parser API...")
+    if pool_health_task is not None:
+        pool_health_task.cancel()
+    await asyncio.to_thread(shutdown_ocr_pool)
 
 
 # Create FastAPI application
@@ -75,6 +126,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "API Support",
         "email": "ai-hackathon2025@geminisolutions.com",
@@ -103,7 +155,7 @@ async def log_requests(request: Request, call_next):
     start_time = time.time()
     
     # Log request
-    logger.info(f"Incoming request: {request.method} {request.url.path}")
+    logger.info("Incoming request: {} {}", request.method, request.url.path)
     
     # Process request
     response = await call_next(request)
@@ -114,8 +166,8 @@ async def log_requests(request: Request, call_next):
     
     # Log response
     logger.info(
-        f"Request completed: {request.method} {request.url.path} "
-        f"Status: {response.status_code} Time: {process_time:.3f}s"
+        "Request completed: {} {} Status: {} Time: {:.3f}s",
+        request.method, request.url.path, response.status_code, process_time
     )
     
     return response
@@ -125,7 +177,7 @@ async def log_requests(request: Request, call_next):
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """Handle 404 errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "NOT_FOUND",
@@ -139,7 +191,7 @@ async def not_found_handler(request: Request, exc):
 async def internal_error_handler(request: Request, exc):
     """Handle 500 errors"""
     logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "INTERNAL_ERROR",
@@ -202,10 +254,16 @@ if __name__ == "__main__":
     
     logger.info(f"Starting server on {settings.API_HOST}:{settings.API_PORT}")
     
+    # "auto" picks uvloop where available (not on Windows); httptools is the
+    # C parser shipped with uvicorn[standard]. uvicorn ignores `workers` when reload is on (DEBUG)
     uvicorn.run(
         "src.main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
-        reload=settings.DEBUG,
-        log_level="info"
+        workers=settings.WORKERS,
+        loop="auto",
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+        reload=settings.DEBUG
     )
\ No newline at end of file
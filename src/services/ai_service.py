@@ -1,25 +1,294 @@
+from pathlib import Path
+from typing import List, Optional, Tuple
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import ahocorasick
+import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 from loguru import logger
 import re
 
+# Dynamic-INT8 ONNX export of the model, built once and reused across restarts
+QUANTIZED_MODEL_DIR = Path("models/flan-t5-large-int8")
+# Present only in a complete, current-format export
+QUANTIZED_DECODER_FILE = "decoder_model_merged_quantized.onnx"
+
+# Prompt input cap (~4 chars per token over FLAN-T5's 512-token window, with headroom);
+# anything longer would be tokenized only to be truncated away
+MAX_PROMPT_INPUT_CHARS = 4096
+
+# Regexes for the fallback field extraction, compiled once
+_NAME_RE = re.compile(r"Name[:\s]*([A-Za-z\s]+)")
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+")
+
+# Versioned skills taxonomy matched in a single pass over the resume text
+SKILL_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skills_taxonomy.json"
+
+
+def _build_skill_automata() -> Tuple["ahocorasick.Automaton", "ahocorasick.Automaton"]:
+    """
+    Build Aho-Corasick automata over the skill names: one over lowercased
+    names, and one over exact names for entries marked `case_sensitive`
+    (skills that are also common English words, e.g. "Excel", "Swift")
+    """
+    with open(SKILL_TAXONOMY_PATH, encoding="utf-8") as f:
+        taxonomy = json.load(f)
+
+    folded = ahocorasick.Automaton()
+    cased = ahocorasick.Automaton()
+    for entry in taxonomy["skills"]:
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        skill = entry["name"]
+        if entry.get("case_sensitive", False):
+            cased.add_word(skill, (len(skill), skill))
+        else:
+            key = skill.lower()
+            folded.add_word(key, (len(key), skill))
+    folded.make_automaton()
+    cased.make_automaton()
+    logger.info(f"Loaded skills taxonomy v{taxonomy['version']} ({len(taxonomy['skills'])} skills)")
+    return folded, cased
+
+
+_skill_automaton, _cased_skill_automaton = _build_skill_automata()
+
+
+def _whole_word_matches(automaton: "ahocorasick.Automaton", text: str):
+    """Yield skills matched by the automaton that aren't inside longer words"""
+    if not len(automaton):
+        return
+    for end, (length, skill) in automaton.iter(text):
+        start = end - length + 1
+        before = text[start - 1] if start > 0 else " "
+        after = text[end + 1] if end + 1 < len(text) else " "
+        # Reject matches inside longer words (e.g. "java" in "javascript")
+        if not before.isalnum() and not after.isalnum():
+            yield skill
+
+
+def extract_skills(text: str) -> List[str]:
+    """Find taxonomy skills in text, matching whole words only"""
+    found = set(_whole_word_matches(_skill_automaton, text.lower()))
+    found.update(_whole_word_matches(_cased_skill_automaton, text))
+    return sorted(found)
+
+
+def _publish_model_dir(build_dir: Path) -> None:
+    """Atomically move a finished build to QUANTIZED_MODEL_DIR"""
+    if QUANTIZED_MODEL_DIR.exists() and not (QUANTIZED_MODEL_DIR / QUANTIZED_DECODER_FILE).exists():
+        # Outdated or partial export from an older build; move it aside first
+        stale_dir = build_dir.with_name(build_dir.name + "-stale")
+        try:
+            os.replace(QUANTIZED_MODEL_DIR, stale_dir)
+            shutil.rmtree(stale_dir, ignore_errors=True)
+        except OSError:
+            pass
+    try:
+        os.replace(build_dir, QUANTIZED_MODEL_DIR)
+    except OSError:
+        # Another process published first; its build is as good as ours
+        if not (QUANTIZED_MODEL_DIR / QUANTIZED_DECODER_FILE).exists():
+            raise
+        logger.info("Quantized model was published by another process; discarding this build")
+
+
+def _compile_with_fallback(forward):
+    """
+    Wrap `forward` in torch.compile, reverting to eager when compilation fails.
+    torch.compile is lazy: Dynamo/Inductor errors (no C++ toolchain, unsupported
+    platform) only surface on a call, so they are caught there. A call that also
+    fails eagerly is a real error and propagates.
+    """
+    compiled = torch.compile(forward, dynamic=True)
+    use_compiled = True
+
+    def run(*args, **kwargs):
+        nonlocal use_compiled
+        if not use_compiled:
+            return forward(*args, **kwargs)
+        try:
+            return compiled(*args, **kwargs)
+        except Exception as e:
+            output = forward(*args, **kwargs)
+            logger.warning(f"torch.compile failed, running eager model: {e}")
+            use_compiled = False
+            return output
+
+    return run
+
+
+class BatchedGenerator:
+    """
+    Coalesces concurrent generation requests into padded batches.
+    Up to `max_batch` prompts arriving within `max_wait_ms` of each other share
+    a single `model.generate` call, which runs off the event loop.
+    """
+
+    # Greedy decoding; built once rather than per generate call
+    GENERATE_KWARGS = {"max_length": 200, "num_beams": 1, "do_sample": False}
+
+    def __init__(self, tokenizer, model, max_batch: int = 8, max_wait_ms: int = 20):
+        self.tokenizer = tokenizer
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _ensure_worker(self):
+        """Start the batching worker on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, prompt: str) -> str:
+        """Queue a prompt and wait for its generated text"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                outputs = await asyncio.to_thread(self._generate_batch, prompts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+    async def generate_many(self, prompts: List[str]) -> List[str]:
+        """Generate for a caller-assembled batch, bypassing the queue, `max_batch` prompts at a time"""
+        outputs = []
+        for start in range(0, len(prompts), self.max_batch):
+            chunk = prompts[start:start + self.max_batch]
+            outputs.extend(await asyncio.to_thread(self._generate_batch, chunk))
+        return outputs
+
+    def _generate_batch(self, prompts: List[str]) -> List[str]:
+        with torch.inference_mode():
+            inputs = self.tokenizer(prompts, padding=True, truncation=True, return_tensors="pt")
+            outputs = self.model.generate(**inputs, **self.GENERATE_KWARGS)
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+
 class LightweightAIService:
     """Lightweight AI service using FLAN-T5 for resource-constrained systems"""
     
     def __init__(self):
         self.model_name = "google/flan-t5-large"
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+        self.model = self._load_model()
+        self.batcher = BatchedGenerator(self.tokenizer, self.model)
         logger.info(f"Loaded {self.model_name} model successfully")
 
-    def generate_summary(self, text: str) -> str:
-        """Generic text generation"""
+    def _load_model(self):
+        """
+        Load the INT8-quantized ONNX Runtime model, building it on first use.
+        Falls back to the FP32 PyTorch model when optimum/onnxruntime is missing.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError:
+            logger.warning("optimum[onnxruntime] not installed; using FP32 PyTorch model")
+            return self._load_torch_model()
+
+        if not (QUANTIZED_MODEL_DIR / QUANTIZED_DECODER_FILE).exists():
+            self._build_quantized_model()
+
+        # Merged decoder handles first step and past-key-value steps in one graph;
+        # optimum turns on IOBinding by itself where the provider supports it
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            QUANTIZED_MODEL_DIR,
+            encoder_file_name="encoder_model_quantized.onnx",
+            decoder_file_name=QUANTIZED_DECODER_FILE,
+            use_merged=True,
+            use_cache=True,
+            provider="CPUExecutionProvider"
+        )
+
+    def _load_torch_model(self):
+        """Load the eager PyTorch model and compile its forward pass"""
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+        model.eval()
+        try:
+            # Compile forward (not the module) so .generate() uses the compiled graph.
+            # Default mode: "reduce-overhead" means CUDA graphs, useless on this CPU path
+            model.forward = _compile_with_fallback(model.forward)
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, running eager model: {e}")
+        return model
+
+    def _build_quantized_model(self):
+        """
+        Export the model to ONNX and apply dynamic INT8 quantization.
+        The build happens in a private temp dir that is renamed into place
+        when complete, so concurrent builders or a crash mid-build never
+        leave a partial model directory behind.
+        """
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        logger.info(f"Building INT8 ONNX model for {self.model_name} (one-time)...")
+        QUANTIZED_MODEL_DIR.parent.mkdir(parents=True, exist_ok=True)
+        build_dir = Path(tempfile.mkdtemp(
+            prefix=f".{QUANTIZED_MODEL_DIR.name}-", dir=QUANTIZED_MODEL_DIR.parent
+        ))
+        # The FP32 export is only quantization input; keep it out of the published dir
+        export_dir = Path(tempfile.mkdtemp(
+            prefix=f".{QUANTIZED_MODEL_DIR.name}-fp32-", dir=QUANTIZED_MODEL_DIR.parent
+        ))
+        try:
+            exported = ORTModelForSeq2SeqLM.from_pretrained(
+                self.model_name, export=True, use_merged=True, use_cache=True
+            )
+            exported.save_pretrained(export_dir)
+
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            for onnx_file in sorted(export_dir.glob("*.onnx")):
+                quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=build_dir, quantization_config=qconfig)
+
+            exported.config.save_pretrained(build_dir)
+            exported.generation_config.save_pretrained(build_dir)
+            _publish_model_dir(build_dir)
+        finally:
+            shutil.rmtree(export_dir, ignore_errors=True)
+            shutil.rmtree(build_dir, ignore_errors=True)
+        logger.info(f"Saved quantized model to {QUANTIZED_MODEL_DIR}")
+
+    async def generate_summary(self, text: str) -> str:
+        """Generic text generation (batched with concurrent requests)"""
         if not isinstance(text, str):
             raise TypeError("Text input must be a string.")
-        inputs = self.tokenizer(text, return_tensors="pt", truncation=True)
-        outputs = self.model.generate(**inputs, max_length=200)
-        return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        return await self.batcher.submit(text)
 
-    def enhance_with_ai(self, text_or_dict):
+    async def enhance_with_ai(self, text_or_dict):
         """
         Enhance text or structured resume data using AI summarization.
         Accepts either plain text or dict input.
@@ -29,19 +298,15 @@ class LightweightAIService:
         # ✅ Handle dict input (structured resume)
         if isinstance(text_or_dict, dict):
             # Merge text fields (skills, experience, education, etc.) for summarization
-            combined_text = ""
-            if "summary" in text_or_dict and isinstance(text_or_dict["summary"], str):
-                combined_text += text_or_dict["summary"] + "\n"
-            if "experience" in text_or_dict:
-                combined_text += " ".join(
-                    [str(exp) for exp in text_or_dict["experience"]]
-                ) + "\n"
-            if "education" in text_or_dict:
-                combined_text += " ".join(
-                    [str(edu) for edu in text_or_dict["education"]]
-                ) + "\n"
-            if "skills" in text_or_dict:
-                combined_text += "Skills: " + ", ".join(text_or_dict["skills"]) + "\n"
+            parts = []
+            if isinstance(text_or_dict.get("summary"), str):
+                parts.append(text_or_dict["summary"])
+            parts.append(" ".join(map(str, text_or_dict.get("experience", []))))
+            parts.append(" ".join(map(str, text_or_dict.get("education", []))))
+            skills = text_or_dict.get("skills")
+            if skills:
+                parts.append("Skills: " + ", ".join(skills))
+            combined_text = "\n".join(p for p in parts if p)
 
             text = (
                 combined_text
@@ -56,39 +321,78 @@ class LightweightAIService:
             )
 
         # Generate enhanced summary
-        prompt = f"Summarize this candidate profile concisely: {text}"
-        enhanced_summary = self.generate_summary(prompt)
+        prompt = f"Summarize this candidate profile concisely: {text[:MAX_PROMPT_INPUT_CHARS]}"
+        enhanced_summary = await self.generate_summary(prompt)
 
         return {"enhancedSummary": enhanced_summary}
 
-    def parse_resume(self, text: str, *args, **kwargs):
+    @staticmethod
+    def _regex_extract(text: str):
+        """Basic regex/automaton extraction of name, email and skills"""
+        name = _NAME_RE.search(text)
+        email = _EMAIL_RE.search(text)
+        return {
+            "name": name.group(1).strip() if name else "Not found",
+            "email": email.group(0) if email else "Not found",
+            "skills": extract_skills(text),
+        }
+
+    @staticmethod
+    def _parse_prompt(text: str) -> str:
+        return (
+            f"Extract name, email, skills, education, and experience from: "
+            f"{text[:MAX_PROMPT_INPUT_CHARS]}"
+        )
+
+    async def parse_resume(self, text: str, *args, **kwargs):
         """
         Lightweight resume parsing — extracts basic info from resume text.
         Handles extra unused arguments gracefully.
+        The regex pass and the model summary share nothing, so they run concurrently.
         """
-        summary = self.generate_summary(
-            f"Extract name, email, skills, education, and experience from: {text}"
+        extracted, summary = await asyncio.gather(
+            asyncio.to_thread(self._regex_extract, text),
+            self.generate_summary(self._parse_prompt(text)),
         )
+        return self._structure(extracted, summary)
 
-        # Basic regex extraction (fallback)
-        name = re.search(r"Name[:\s]*([A-Za-z\s]+)", text)
-        email = re.search(r"[\w\.-]+@[\w\.-]+", text)
-        skills = re.findall(
-            r"(Python|Java|C\+\+|Machine Learning|FastAPI|Django|SQL)", text, re.I
+    async def parse_resume_batch(self, texts: List[str]) -> List[dict]:
+        """
+        Parse several resume texts with padded `model.generate` calls of up to
+        `max_batch` prompts each. Results are returned in input order.
+        """
+        extracted, summaries = await asyncio.gather(
+            asyncio.to_thread(lambda: [self._regex_extract(text) for text in texts]),
+            self.batcher.generate_many([self._parse_prompt(text) for text in texts]),
         )
+        return [self._structure(e, s) for e, s in zip(extracted, summaries)]
 
+    @staticmethod
+    def _structure(extracted: dict, summary: str) -> dict:
+        """Shape extracted fields and the model summary into the parse result"""
         # Return consistent structure
         return {
             "personalInfo": {
-                "name": name.group(1).strip() if name else "Not found",
-                "contact": {"email": email.group(0) if email else "Not found"},
+                "name": extracted["name"],
+                "contact": {"email": extracted["email"]},
             },
-            "skills": list(set(skills)) if skills else [],
+            "skills": extracted["skills"],
             "experience": [],
             "education": [],
             "summary": summary,
         }
 
 
-# ✅ Global instance for import
-ai_service = LightweightAIService()
+# ✅ Lazily-created global instance (model loads on first use, not at import)
+ai_service = None
+_ai_service_lock = threading.Lock()
+
+
+def get_ai_service() -> LightweightAIService:
+    """Return the shared AI service, loading the model on first call"""
+    global ai_service
+    if ai_service is None:
+        with _ai_service_lock:
+            if ai_service is None:
+                ai_service = LightweightAIService()
+    return ai_service
@@ -3,44 +3,243 @@ Resume Parser Service
 Coordinates document extraction, AI parsing, and data enhancement
 """
 
+import asyncio
+import io
 import os
 import hashlib
-from typing import Dict, Any, Optional, BinaryIO
+from typing import Dict, Any, List, Optional, BinaryIO, Union
 from datetime import datetime
 from loguru import logger
+import numpy as np
 
-from src.services.ai_service import ai_service
+from src.services.ai_service import get_ai_service
 from src.utils.pdf_extractor import extract_text_from_pdf
 from src.utils.docx_extractor import extract_text_from_docx
 from src.utils.validators import validate_email, validate_phone
 from src.config import settings
 
+
+# Block size used when hashing file-like uploads
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on resumes parsed at once, so bursts don't thrash CPU and memory
+MAX_CONCURRENT_PARSES = 4
+_parse_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PARSES)
+
+# Characters of extracted text kept in the result for reference
+RAW_TEXT_PREVIEW_CHARS = 5000
+
+# A model summary at least this long is kept as is; enhancement would only regenerate it
+ADEQUATE_SUMMARY_CHARS = 80
+
+
+def _normalize_month(value: str, default_month: int) -> Optional[str]:
+    """
+    Normalize 'YYYY', 'YYYY-M' or 'YYYY-MM[-DD]' to 'YYYY-MM'.
+    Returns None when the year or month isn't a number.
+    """
+    parts = value.split('-')
+    try:
+        year = int(parts[0])
+        month = int(parts[1]) if len(parts) > 1 else default_month
+    except ValueError:
+        return None
+    return f"{year:04d}-{month:02d}"
+
+
+def _to_month_array(values: list, default_month: int) -> np.ndarray:
+    """
+    Convert date strings (see `_normalize_month`) to a datetime64[M] array.
+    Missing or unparseable values become NaT.
+    """
+    normalized = [
+        _normalize_month(value, default_month) if isinstance(value, str) else None
+        for value in values
+    ]
+    try:
+        return np.array(normalized, dtype='datetime64[M]')
+    except ValueError:
+        months = np.full(len(normalized), np.datetime64('NaT'), dtype='datetime64[M]')
+        for i, value in enumerate(normalized):
+            try:
+                months[i] = np.datetime64(value, 'M')
+            except (ValueError, TypeError):
+                continue
+        return months
+
+
+def _as_stream(file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Return a seekable binary stream positioned at the start of the content"""
+    if isinstance(file_content, (bytes, bytearray)):
+        return io.BytesIO(file_content)
+    file_content.seek(0)
+    return file_content
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    """Size of a seekable stream in bytes"""
+    stream.seek(0, io.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def _stream_sha256(stream: BinaryIO) -> str:
+    """SHA-256 of a seekable stream, read in fixed-size blocks"""
+    digest = hashlib.sha256()
+    stream.seek(0)
+    while chunk := stream.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
     
 class ParserService:
     """Main resume parsing service"""
     
     def __init__(self):
         """Initialize parser service"""
-        self.ai_service = ai_service
+        self._ai_service = None
+
+    async def get_ai_service(self):
+        """Shared AI service; the first call loads the model off the event loop"""
+        if self._ai_service is None:
+            self._ai_service = await asyncio.to_thread(get_ai_service)
+        return self._ai_service
         
     async def parse_resume(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         filename: str,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        precomputed_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Parse resume from file content
         
         Args:
-            file_content: Binary file content
+            file_content: Binary file content, or a seekable binary file object
             filename: Original filename
             options: Parsing options
+            precomputed_hash: SHA-256 hex digest of the content, if the caller
+                already computed it while reading the upload
         
         Returns:
             Complete parsed resume data
         """
         options = options or {}
+        file_content = _as_stream(file_content)
+        file_hash = precomputed_hash or await asyncio.to_thread(_stream_sha256, file_content)
+
+        async with _parse_semaphore:
+            return await self._parse_resume(file_content, filename, options, file_hash)
+
+    async def parse_batch(
+        self,
+        contents: List[Union[bytes, BinaryIO]],
+        filenames: List[str],
+        options: Optional[Dict[str, Any]] = None,
+        file_hashes: Optional[List[str]] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Parse several resumes together
+        
+        Text is extracted from the files concurrently (bounded), and the
+        files that yield text share batched model calls.
+        
+        Args:
+            contents: Binary file contents or seekable binary file objects
+            filenames: Original filenames, aligned with `contents`
+            options: Parsing options applied to every file
+            file_hashes: SHA-256 hex digests aligned with `contents`, if known
+        
+        Returns:
+            Parsed resume data in input order; a file that failed to parse
+            has its exception in its slot instead
+        """
+        options = options or {}
+        streams = [_as_stream(content) for content in contents]
+        if file_hashes is None:
+            file_hashes = await asyncio.gather(
+                *(asyncio.to_thread(_stream_sha256, stream) for stream in streams)
+            )
+
+        async with _parse_semaphore:
+            return await self._parse_batch(streams, filenames, options, file_hashes)
+
+    async def _parse_batch(
+        self,
+        streams: List[BinaryIO],
+        filenames: List[str],
+        options: Dict[str, Any],
+        file_hashes: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Batch pipeline body; see `parse_batch`"""
+        start_time = datetime.now()
+        logger.info(f"Starting batch parsing of {len(streams)} resumes")
+
+        # The batch holds one parse slot; keep its own extraction fan-out
+        # to the same bound as concurrent single-file parses
+        extract_slots = asyncio.Semaphore(MAX_CONCURRENT_PARSES)
+
+        async def extract(stream: BinaryIO, filename: str) -> str:
+            async with extract_slots:
+                return await self._extract_text(stream, filename, options)
+
+        texts = await asyncio.gather(
+            *(extract(stream, filename) for stream, filename in zip(streams, filenames)),
+            return_exceptions=True
+        )
+
+        outcomes: List[Union[Dict[str, Any], Exception]] = []
+        ready = []
+        for i, text in enumerate(texts):
+            if isinstance(text, Exception):
+                outcomes.append(text)
+            elif not text or len(text.strip()) < 50:
+                outcomes.append(ValueError("Could not extract sufficient text from document"))
+            else:
+                outcomes.append(None)
+                ready.append(i)
+
+        if ready:
+            ready_texts = [texts[i] for i in ready]
+            text_lengths = [len(text) for text in ready_texts]
+            previews = [text[:RAW_TEXT_PREVIEW_CHARS] for text in ready_texts]
+            del texts
+
+            ai_service = await self.get_ai_service()
+            structured = await ai_service.parse_resume_batch(ready_texts)
+            # Only the lengths and previews are needed from here on
+            del ready_texts
+
+            completed = await asyncio.gather(
+                *(self._complete_parse(
+                    data, streams[i], filenames[i], options, file_hashes[i],
+                    start_time, text_length, preview
+                ) for i, data, text_length, preview in zip(
+                    ready, structured, text_lengths, previews
+                )),
+                return_exceptions=True
+            )
+            for i, outcome in zip(ready, completed):
+                outcomes[i] = outcome
+
+        failed = sum(isinstance(outcome, Exception) for outcome in outcomes)
+        logger.info(
+            f"Batch parsing of {len(streams)} resumes completed in "
+            f"{(datetime.now() - start_time).total_seconds():.2f}s ({failed} failed)"
+        )
+        return outcomes
+
+    async def _parse_resume(
+        self,
+        file_content: BinaryIO,
+        filename: str,
+        options: Dict[str, Any],
+        file_hash: str
+    ) -> Dict[str, Any]:
+        """Parse pipeline body; see `parse_resume`"""
         start_time = datetime.now()
         
         try:
@@ -53,56 +252,92 @@ class ParserService:
             if not raw_text or len(raw_text.strip()) < 50:
                 raise ValueError("Could not extract sufficient text from document")
             
-            logger.info(f"Extracted {len(raw_text)} characters of text")
+            raw_text_length = len(raw_text)
+            raw_text_preview = raw_text[:RAW_TEXT_PREVIEW_CHARS]
+            logger.info(f"Extracted {raw_text_length} characters of text")
             
             # Step 2: Parse with AI
             logger.info("Step 2: Parsing with AI (GPT-4)...")
-            structured_data = self.ai_service.parse_resume(raw_text, options)
-            
-            # Step 3: Enhance with AI if enabled
-            ai_enhancements = {}
-            if options.get('enhanceWithAI', True):
-                logger.info("Step 3: Enhancing with AI insights...")
-                ai_enhancements = self.ai_service.enhance_with_ai(structured_data)
-            
-            # Step 4: Calculate metadata
-            logger.info("Step 4: Calculating metadata...")
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            metadata = {
-                "fileName": filename,
-                "fileSize": len(file_content),
-                "fileType": self._get_file_type(filename),
-                "fileHash": hashlib.sha256(file_content).hexdigest(),
-                "uploadedAt": start_time.isoformat(),
-                "processedAt": datetime.now().isoformat(),
-                "processingTime": round(processing_time, 2),
-                "rawTextLength": len(raw_text),
-                "parsingMethod": "AI-GPT4"
-            }
-            
-            # Step 5: Combine all data
-            complete_data = {
-                "metadata": metadata,
-                "rawText": raw_text[:5000],  # Store first 5000 chars for reference
-                **structured_data,
-                "aiEnhancements": ai_enhancements
-            }
+            ai_service = await self.get_ai_service()
+            structured_data = await ai_service.parse_resume(raw_text, options)
             
-            # Step 6: Post-process and validate
-            complete_data = self._post_process(complete_data)
+            # Only the preview is needed from here on; release the full text
+            # so it isn't held through enhancement and post-processing
+            del raw_text
             
-            logger.info(f"Resume parsing completed in {processing_time:.2f}s")
-            
-            return complete_data
+            return await self._complete_parse(
+                structured_data, file_content, filename, options, file_hash,
+                start_time, raw_text_length, raw_text_preview
+            )
             
         except Exception as e:
             logger.error(f"Resume parsing failed: {e}")
             raise
+
+    async def _complete_parse(
+        self,
+        structured_data: Dict[str, Any],
+        file_content: BinaryIO,
+        filename: str,
+        options: Dict[str, Any],
+        file_hash: str,
+        start_time: datetime,
+        raw_text_length: int,
+        raw_text_preview: str
+    ) -> Dict[str, Any]:
+        """Enhance, annotate and post-process the model's structured output"""
+        # Step 3: Enhance with AI if enabled and the summary isn't already adequate
+        ai_enhancements = {}
+        summary_length = len(str(structured_data.get('summary') or ''))
+        enhance = False
+        if options.get('forceEnhance', False):
+            logger.info("Step 3: Enhancing with AI insights (forced)...")
+            enhance = True
+        elif not options.get('enhanceWithAI', True):
+            logger.info("Step 3: Skipping AI enhancement (disabled)")
+        elif summary_length >= ADEQUATE_SUMMARY_CHARS:
+            logger.info(f"Step 3: Skipping AI enhancement (summary already {summary_length} chars)")
+        else:
+            logger.info("Step 3: Enhancing with AI insights...")
+            enhance = True
+        if enhance:
+            ai_service = await self.get_ai_service()
+            ai_enhancements = await ai_service.enhance_with_ai(structured_data)
+        
+        # Step 4: Calculate metadata
+        logger.info("Step 4: Calculating metadata...")
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        metadata = {
+            "fileName": filename,
+            "fileSize": _stream_size(file_content),
+            "fileType": self._get_file_type(filename),
+            "fileHash": file_hash,
+            "uploadedAt": start_time.isoformat(),
+            "processedAt": datetime.now().isoformat(),
+            "processingTime": round(processing_time, 2),
+            "rawTextLength": raw_text_length,
+            "parsingMethod": "AI-GPT4"
+        }
+        
+        # Step 5: Combine all data
+        complete_data = {
+            "metadata": metadata,
+            "rawText": raw_text_preview,  # Store first 5000 chars for reference
+            **structured_data,
+            "aiEnhancements": ai_enhancements
+        }
+        
+        # Step 6: Post-process and validate
+        complete_data = self._post_process(complete_data)
+        
+        logger.info(f"Resume parsing completed in {processing_time:.2f}s")
+        
+        return complete_data
     
     async def _extract_text(
         self,
-        file_content: bytes,
+        file_content: BinaryIO,
         filename: str,
         options: Dict[str, Any]
     ) -> str:
@@ -110,7 +345,7 @@ class ParserService:
         Extract text from various file formats
         
         Args:
-            file_content: Binary file content
+            file_content: Seekable binary file object
             filename: Original filename
             options: Extraction options
         
@@ -121,19 +356,21 @@ class ParserService:
         
         try:
             if file_ext == 'pdf':
-                text = extract_text_from_pdf(file_content, options.get('performOCR', True))
+                text = await asyncio.to_thread(
+                    extract_text_from_pdf, file_content, options.get('performOCR', True)
+                )
             
             elif file_ext in ['docx', 'doc']:
-                text = extract_text_from_docx(file_content)
+                text = await asyncio.to_thread(extract_text_from_docx, file_content)
             
             elif file_ext == 'txt':
-                text = file_content.decode('utf-8', errors='ignore')
+                text = file_content.read().decode('utf-8', errors='ignore')
             
             elif file_ext in ['jpg', 'jpeg', 'png']:
                 # For images, always use OCR
                 if options.get('performOCR', True):
                     from src.utils.pdf_extractor import extract_text_from_image
-                    text = extract_text_from_image(file_content)
+                    text = await asyncio.to_thread(extract_text_from_image, file_content)
                 else:
                     raise ValueError("OCR is required for image files but was disabled")
             
@@ -219,35 +456,21 @@ class ParserService:
         if not experiences:
             return 0.0
         
-        total_months = 0
+        current = datetime.now().strftime('%Y-%m')
+        starts = _to_month_array([exp.get('startDate') for exp in experiences], 1)
+        # A missing or non-string end date means the role is ongoing
+        end_dates = [exp.get('endDate') or current for exp in experiences]
+        ends = _to_month_array(
+            [end if isinstance(end, str) else current for end in end_dates], 12
+        )
         
-        for exp in experiences:
-            start_date = exp.get('startDate')
-            end_date = exp.get('endDate') or datetime.now().strftime('%Y-%m')
-            
-            if start_date:
-                try:
-                    # Parse dates (assuming YYYY-MM format)
-                    start_parts = start_date.split('-')
-                    end_parts = end_date.split('-') if isinstance(end_date, str) else [
-                        datetime.now().year, datetime.now().month
-                    ]
-                    
-                    start_year = int(start_parts[0])
-                    start_month = int(start_parts[1]) if len(start_parts) > 1 else 1
-                    
-                    end_year = int(end_parts[0])
-                    end_month = int(end_parts[1]) if len(end_parts) > 1 else 12
-                    
-                    # Calculate months
-                    months = (end_year - start_year) * 12 + (end_month - start_month)
-                    total_months += max(0, months)
-                    
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Could not parse dates: {start_date} to {end_date}")
-                    continue
+        # Entries with a missing or unparseable date are skipped
+        valid = ~(np.isnat(starts) | np.isnat(ends))
+        if not valid.all():
+            logger.warning(f"Could not parse dates for {int((~valid).sum())} experience entries")
         
-        return round(total_months / 12, 1)
+        months = (ends[valid] - starts[valid]).astype(np.int64)
+        return round(float(np.clip(months, 0, None).sum()) / 12, 1)
     
     def _get_file_type(self, filename: str) -> str:
         """Get file MIME type from filename"""
@@ -280,4 +503,9 @@ class ParserService:
 
 
 # Global parser service instance
-parser_service = ParserService()
\ No newline at end of file
+parser_service = ParserService()
+
+
+def get_parser_service() -> ParserService:
+    """Route dependency returning the shared parser service (overridable in tests)"""
+    return parser_service
\ No newline at end of file
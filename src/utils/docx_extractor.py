@@ -1,15 +1,20 @@
 # src/utils/docx_extractor.py
 
 import io
+from typing import BinaryIO, Union
 from docx import Document
 
-def extract_text_from_docx(file_content: bytes) -> str:
+def extract_text_from_docx(file_content: Union[bytes, BinaryIO]) -> str:
     """
-    Extracts text content from a DOCX file given its bytes.
+    Extracts text content from a DOCX file given its bytes or a binary file object.
     """
     try:
-        # Use BytesIO to handle in-memory file uploads
-        doc = Document(io.BytesIO(file_content))
+        # Use BytesIO to handle in-memory file uploads; file objects are read in place
+        if isinstance(file_content, (bytes, bytearray)):
+            file_content = io.BytesIO(file_content)
+        else:
+            file_content.seek(0)
+        doc = Document(file_content)
         text = "\n".join([para.text for para in doc.paragraphs])
         return text.strip()
     except Exception as e:
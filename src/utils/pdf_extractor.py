@@ -4,7 +4,12 @@ Supports both text-based PDFs and scanned PDFs with OCR
 """
 
 import io
-from typing import Union
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Optional, Union
+import fitz  # PyMuPDF
 import PyPDF2
 import pdfplumber
 from PIL import Image
@@ -18,13 +23,87 @@ except ImportError:
     OCR_AVAILABLE = False
     logger.warning("OCR libraries not available. Install pytesseract and pdf2image for OCR support.")
 
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Resolution for OCR; 150 DPI is plenty for Latin-script resumes
+OCR_DPI = 150
+
+# Long-lived OCR workers, created on first use so each server worker gets its own.
+# Spawned rather than forked: the parent runs onnxruntime/torch threads.
+OCR_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_ocr_pool: Optional[ProcessPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
+
+# Per-process Tesseract engine, kept resident between pages
+_tess_api = None
+
+
+def _get_ocr_pool() -> ProcessPoolExecutor:
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _ocr_pool_lock:
+            if _ocr_pool is None:
+                _ocr_pool = ProcessPoolExecutor(
+                    max_workers=OCR_MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _ocr_pool
+
+
+def shutdown_ocr_pool() -> None:
+    """Stop the OCR worker processes, if any were started"""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _ocr_page(image: Image.Image) -> str:
+    """OCR a single page image inside a pool worker"""
+    global _tess_api
+    if _tess_api is None:
+        _tess_api = tesserocr.PyTessBaseAPI(lang='eng')
+    _tess_api.SetImage(image)
+    return _tess_api.GetUTF8Text()
+
+
+def _downsample(image: Image.Image, dpi: int = OCR_DPI) -> Image.Image:
+    """Scale an image down to `dpi` when its embedded resolution is higher"""
+    source_dpi = image.info.get("dpi", (0, 0))[0]
+    if not source_dpi or source_dpi <= dpi:
+        return image
+    scale = dpi / float(source_dpi)
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    return image.resize(size, Image.LANCZOS)
+
+
+def _open_stream(content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Return a seekable stream over the content, rewound to the start"""
+    if isinstance(content, (bytes, bytearray)):
+        return io.BytesIO(content)
+    content.seek(0)
+    return content
+
+
+def _read_bytes(content: Union[bytes, BinaryIO]) -> bytes:
+    """Materialize the content as bytes (only for libraries that require it)"""
+    if isinstance(content, (bytes, bytearray)):
+        return bytes(content)
+    content.seek(0)
+    return content.read()
 
-def extract_text_from_pdf(pdf_content: bytes, use_ocr: bool = True) -> str:
+
+def extract_text_from_pdf(pdf_content: Union[bytes, BinaryIO], use_ocr: bool = True) -> str:
     """
     Extract text from PDF using multiple methods
     
     Args:
-        pdf_content: PDF file content as bytes
+        pdf_content: PDF file content as bytes or a seekable binary file object
         use_ocr: Whether to use OCR for scanned PDFs
     
     Returns:
@@ -33,7 +112,15 @@ def extract_text_from_pdf(pdf_content: bytes, use_ocr: bool = True) -> str:
     text = ""
     
     try:
-        # Method 1: Try pdfplumber first (best for structured PDFs)
+        # Method 1: Try PyMuPDF first (fast native single-pass extraction)
+        logger.info("Attempting text extraction with PyMuPDF...")
+        text = _extract_with_pymupdf(pdf_content)
+        
+        if text and len(text.strip()) > 100:
+            logger.info(f"Successfully extracted {len(text)} characters with PyMuPDF")
+            return text
+        
+        # Method 2: Try pdfplumber (handles some malformed PDFs)
         logger.info("Attempting text extraction with pdfplumber...")
         text = _extract_with_pdfplumber(pdf_content)
         
@@ -41,7 +128,7 @@ def extract_text_from_pdf(pdf_content: bytes, use_ocr: bool = True) -> str:
             logger.info(f"Successfully extracted {len(text)} characters with pdfplumber")
             return text
         
-        # Method 2: Try PyPDF2 as fallback
+        # Method 3: Try PyPDF2 as fallback
         logger.info("Attempting text extraction with PyPDF2...")
         text = _extract_with_pypdf2(pdf_content)
         
@@ -49,7 +136,7 @@ def extract_text_from_pdf(pdf_content: bytes, use_ocr: bool = True) -> str:
             logger.info(f"Successfully extracted {len(text)} characters with PyPDF2")
             return text
         
-        # Method 3: Use OCR if enabled and text extraction failed
+        # Method 4: Use OCR if enabled and text extraction failed
         if use_ocr and OCR_AVAILABLE:
             logger.info("Text extraction failed, attempting OCR...")
             text = _extract_with_ocr(pdf_content)
@@ -69,10 +156,21 @@ def extract_text_from_pdf(pdf_content: bytes, use_ocr: bool = True) -> str:
         raise
 
 
-def _extract_with_pdfplumber(pdf_content: bytes) -> str:
+def _extract_with_pymupdf(pdf_content: Union[bytes, BinaryIO]) -> str:
+    """Extract text using PyMuPDF"""
+    try:
+        with fitz.open(stream=_read_bytes(pdf_content), filetype="pdf") as doc:
+            return "\n\n".join(page.get_text("text") for page in doc)
+        
+    except Exception as e:
+        logger.warning(f"PyMuPDF extraction failed: {e}")
+        return ""
+
+
+def _extract_with_pdfplumber(pdf_content: Union[bytes, BinaryIO]) -> str:
     """Extract text using pdfplumber"""
     try:
-        pdf_file = io.BytesIO(pdf_content)
+        pdf_file = _open_stream(pdf_content)
         text_parts = []
         
         with pdfplumber.open(pdf_file) as pdf:
@@ -88,10 +186,10 @@ def _extract_with_pdfplumber(pdf_content: bytes) -> str:
         return ""
 
 
-def _extract_with_pypdf2(pdf_content: bytes) -> str:
+def _extract_with_pypdf2(pdf_content: Union[bytes, BinaryIO]) -> str:
     """Extract text using PyPDF2"""
     try:
-        pdf_file = io.BytesIO(pdf_content)
+        pdf_file = _open_stream(pdf_content)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
         text_parts = []
         
@@ -107,7 +205,7 @@ def _extract_with_pypdf2(pdf_content: bytes) -> str:
         return ""
 
 
-def _extract_with_ocr(pdf_content: bytes) -> str:
+def _extract_with_ocr(pdf_content: Union[bytes, BinaryIO]) -> str:
     """Extract text using OCR (for scanned PDFs)"""
     if not OCR_AVAILABLE:
         logger.error("OCR libraries not available")
@@ -115,30 +213,33 @@ def _extract_with_ocr(pdf_content: bytes) -> str:
     
     try:
         # Convert PDF to images
-        images = convert_from_bytes(pdf_content)
-        text_parts = []
+        images = convert_from_bytes(
+            _read_bytes(pdf_content), dpi=OCR_DPI, fmt='png', thread_count=4
+        )
         
-        # Perform OCR on each page
-        for i, image in enumerate(images):
-            logger.info(f"Performing OCR on page {i+1}/{len(images)}...")
-            page_text = pytesseract.image_to_string(image, lang='eng')
-            
-            if page_text:
-                text_parts.append(page_text)
+        # Perform OCR on all pages in parallel with resident Tesseract engines
+        if TESSEROCR_AVAILABLE:
+            logger.info(f"Performing OCR on {len(images)} pages with tesserocr pool...")
+            page_texts = list(_get_ocr_pool().map(_ocr_page, images))
+        else:
+            page_texts = []
+            for i, image in enumerate(images):
+                logger.info(f"Performing OCR on page {i+1}/{len(images)}...")
+                page_texts.append(pytesseract.image_to_string(image, lang='eng'))
         
-        return "\n\n".join(text_parts)
+        return "\n\n".join(text for text in page_texts if text)
         
     except Exception as e:
         logger.error(f"OCR extraction failed: {e}")
         return ""
 
 
-def extract_text_from_image(image_content: bytes) -> str:
+def extract_text_from_image(image_content: Union[bytes, BinaryIO]) -> str:
     """
     Extract text from image using OCR
     
     Args:
-        image_content: Image file content as bytes
+        image_content: Image file content as bytes or a seekable binary file object
     
     Returns:
         Extracted text
@@ -147,12 +248,16 @@ def extract_text_from_image(image_content: bytes) -> str:
         raise ValueError("OCR libraries not available. Install pytesseract and pdf2image.")
     
     try:
-        # Open image
-        image = Image.open(io.BytesIO(image_content))
+        # Open image and bring it down to OCR resolution
+        image = _downsample(Image.open(_open_stream(image_content)))
         
         # Perform OCR
         logger.info("Performing OCR on image...")
-        text = pytesseract.image_to_string(image, lang='eng')
+        if TESSEROCR_AVAILABLE:
+            # Reuse the pool's resident engine instead of loading a new one per upload
+            text = _get_ocr_pool().submit(_ocr_page, image).result()
+        else:
+            text = pytesseract.image_to_string(image, lang='eng')
         
         if not text or len(text.strip()) < 50:
             raise ValueError("Could not extract sufficient text from image")
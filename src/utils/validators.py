@@ -1,8 +1,8 @@
 # src/utils/validators.py
 
-from pydantic import BaseModel
-from typing import List, Optional
-import os
+from pydantic import BaseModel, ConfigDict
+from typing import FrozenSet, List, Optional
+from functools import lru_cache
 import re
 from src.config import settings
 
@@ -39,6 +39,8 @@ class Project(BaseModel):
 
 
 class Resume(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     name: str
     contact_info: ContactInfo
     summary: Optional[str]
@@ -50,14 +52,17 @@ class Resume(BaseModel):
 
 # ---------- VALIDATION HELPERS ----------
 
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+_PHONE_RE = re.compile(r"^\+?[0-9]{7,15}$")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+
 def validate_email(email: str) -> bool:
-    email_regex = r"^[\w\.-]+@[\w\.-]+\.\w+$"
-    return bool(re.match(email_regex, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_phone(phone: str) -> bool:
-    phone_regex = r"^\+?[0-9]{7,15}$"
-    return bool(re.match(phone_regex, phone))
+    return bool(_PHONE_RE.match(phone))
 
 
 def validate_file_size(file_size: int, max_size: int) -> bool:
@@ -65,13 +70,22 @@ def validate_file_size(file_size: int, max_size: int) -> bool:
     return file_size <= max_size
 
 
-def validate_file_extension(filename: str, allowed_extensions) -> bool:
-    """Validate that the file extension is allowed"""
-    ext = os.path.splitext(filename)[1].lower().replace('.', '')
-    return ext in [e.lower() for e in allowed_extensions]
+@lru_cache(maxsize=2048)
+def validate_file_extension(extension: str, allowed_extensions: FrozenSet[str]) -> bool:
+    """Validate that the file extension (without the dot) is allowed"""
+    return extension.lower() in allowed_extensions
 
 
+@lru_cache(maxsize=2048)
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent unsafe paths"""
-    sanitized = re.sub(r'[^A-Za-z0-9_.-]', '_', filename)
+    sanitized = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
     return sanitized
+
+
+def validators_cache_info() -> dict:
+    """Hit/miss statistics for the memoized validators"""
+    return {
+        fn.__name__: fn.cache_info()._asdict()
+        for fn in (validate_file_extension, sanitize_filename)
+    }
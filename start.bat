@@ -56,6 +56,16 @@ REM Wait for database
 echo Waiting for database to start...
 timeout /t 5 /nobreak
 
+REM Apply database migrations once, before any API worker starts
+echo.
+echo Applying database migrations...
+python scripts/init_db.py
+if errorlevel 1 (
+    echo ERROR: Database migration failed
+    pause
+    exit /b 1
+)
+
 REM Start the application
 echo.
 echo ========================================
@@ -55,6 +55,10 @@ else
     echo "PostgreSQL is already running ✓"
 fi
 
+# Apply database migrations once, before any API worker starts
+echo -e "\n${YELLOW}Applying database migrations...${NC}"
+python scripts/init_db.py
+
 # Download model (optional, will download on first use)
 echo -e "\n${YELLOW}Checking Hugging Face model...${NC}"
 echo "Model will be downloaded on first use (this may take a few minutes)"
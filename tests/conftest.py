@@ -0,0 +1,234 @@
+"""
+Shared fixtures for the API tests
+"""
+
+import asyncio
+from contextlib import contextmanager
+from functools import lru_cache
+
+import httpx
+import pytest
+import pytest_asyncio
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+
+# Sample resumes uploaded by `uploaded_resume_id`, as `resume_factory` arguments
+SAMPLE_RESUMES = {
+    "jane": {
+        "name": "Jane Smith",
+        "contact": "jane.smith@example.com",
+        "skills": ["Python", "R", "TensorFlow", "SQL"],
+        "sections": {
+            "EXPERIENCE": [
+                "Data Scientist | Analytics Co | 2019-2024",
+                "- Built ML models for customer segmentation",
+                "- Improved prediction accuracy by 25%",
+            ],
+        },
+    },
+    "alex": {
+        "name": "Alex Johnson",
+        "contact": "alex.j@email.com | +1-555-999-8888",
+        "skills": ["Python", "JavaScript", "AWS", "Docker", "Kubernetes", "PostgreSQL", "React"],
+        "sections": {
+            "EXPERIENCE": [
+                "Senior Software Engineer | TechStart | 2018-2024",
+                "- Built scalable microservices with Python and Docker",
+                "- Led AWS migration project",
+                "- Mentored junior developers",
+            ],
+            "EDUCATION": [
+                "MS Computer Science | Stanford University | 2018",
+                "BS Computer Science | UC Berkeley | 2016",
+            ],
+            "CERTIFICATIONS": ["AWS Certified Solutions Architect"],
+        },
+    },
+}
+
+# Canned parse result for API-contract tests; matches the Resume schema
+FAKE_PARSED_RESUME = {
+    "name": "Jane Smith",
+    "contact_info": {
+        "email": "jane.smith@example.com",
+        "phone": None,
+        "linkedin": None,
+        "location": None,
+        "portfolio": None,
+    },
+    "summary": "Data scientist with five years of ML experience.",
+    "skills": ["Python", "R", "TensorFlow", "SQL"],
+    "metadata": {"fileName": "jane_resume.txt", "parsingMethod": "fake"},
+}
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session, shared by the session-scoped client"""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported on first use so collection doesn't load the service stack"""
+    from src.main import app
+    return app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(app):
+    """
+    Async client that calls the app in-process over ASGI.
+    The app's lifespan runs once per session (per xdist worker), not per test.
+    The transport awaits the whole ASGI call, background tasks included,
+    so an upload's parse has finished by the time its response returns.
+    """
+    async with LifespanManager(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+
+
+# Read-only requests that don't depend on test state, issued together once per session
+# (plus a lookup of `missing_id`)
+WARM_READS = {
+    "health": ("/api/v1/health", None),
+}
+
+
+class FakeParser:
+    """Stands in for ParserService, skipping text extraction and the model"""
+
+    async def parse_resume(self, file_content, filename, options=None, precomputed_hash=None):
+        return dict(FAKE_PARSED_RESUME, metadata={**FAKE_PARSED_RESUME["metadata"], "fileName": filename})
+
+    async def parse_batch(self, contents, filenames, options=None, file_hashes=None):
+        return [await self.parse_resume(content, filename) for content, filename in zip(contents, filenames)]
+
+
+@contextmanager
+def fake_parsing(app):
+    """Route parsing through FakeParser for the duration of the block"""
+    from src.api.routes import resumes
+    from src.services.parser_service import get_parser_service
+
+    app.dependency_overrides[get_parser_service] = FakeParser
+    try:
+        yield
+    finally:
+        app.dependency_overrides.pop(get_parser_service, None)
+        # Don't let canned results answer later uploads of the same content
+        with resumes.parse_cache_lock:
+            resumes.parse_cache.clear()
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warmup(app, client):
+    """
+    Exercise the health and upload paths once before any test runs, so
+    first-call costs (route setup, schema validation, caches) aren't
+    attributed to whichever test happens to go first. Parsing is faked.
+    """
+    await client.get("/api/v1/health")
+    with fake_parsing(app):
+        await client.post(
+            "/api/v1/resumes/upload",
+            files={"file": ("warmup.txt", b"warm", "text/plain")}
+        )
+
+
+@pytest.fixture(scope="session")
+def missing_id(worker_id):
+    """A resume ID that never exists, distinct per xdist worker ("gw3" -> ...0003)"""
+    worker_number = int(worker_id[2:]) if worker_id.startswith("gw") else 0
+    return f"00000000-0000-0000-0000-{worker_number:012d}"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def warm_reads(client, missing_id):
+    """Responses to WARM_READS, fetched concurrently and shared by the read-only tests"""
+    reads = {**WARM_READS, "missing_resume": (f"/api/v1/resumes/{missing_id}", None)}
+    responses = await asyncio.gather(
+        *(client.get(url, params=params) for url, params in reads.values())
+    )
+    return dict(zip(reads, responses))
+
+
+@pytest.fixture(scope="session")
+def health_data(warm_reads):
+    """Decoded /health body, parsed once per session"""
+    return warm_reads["health"].json()
+
+
+@pytest.fixture(scope="class")
+def fake_parser(app):
+    """Route parsing through FakeParser for API-contract tests"""
+    with fake_parsing(app):
+        yield
+
+
+def encode_multipart(files):
+    """Multipart-encode `files` (as for httpx's `files=`); returns the body and content type"""
+    request = httpx.Request("POST", "/", files=files)
+    return request.read(), request.headers["content-type"]
+
+
+def multipart_upload(files):
+    """Encode a multipart body once; returns `client.post` kwargs that reuse it"""
+    content, content_type = encode_multipart(files)
+    return {"content": content, "headers": {"content-type": content_type}}
+
+
+@lru_cache(maxsize=None)
+def encode_upload(filename, body):
+    """Multipart-encode a text resume upload; repeat uploads reuse the framed bytes"""
+    return encode_multipart({"file": (filename, body, "text/plain")})
+
+
+def build_resume(name, contact, skills, sections=None):
+    """Assemble a plain-text resume from its parts"""
+    lines = [name, contact, ""]
+    for heading, entries in (sections or {}).items():
+        lines += [heading, *entries, ""]
+    lines += ["SKILLS", ", ".join(skills)]
+    return "\n".join(lines).encode()
+
+
+@pytest_asyncio.fixture(scope="class")
+async def resume_factory(client):
+    """
+    Upload a resume built from parts and return its ID.
+    ASGITransport only returns once the app, background tasks included,
+    has finished, so the resume is already parsed.
+    Identical resumes are uploaded once per test class and share an ID.
+    """
+    uploaded = {}
+
+    async def _make(name, contact, skills, sections=None):
+        body = build_resume(name, contact, skills, sections)
+        if body in uploaded:
+            return uploaded[body]
+
+        content, content_type = encode_upload(f"{name.split()[0].lower()}_resume.txt", body)
+        response = await client.post(
+            "/api/v1/resumes/upload",
+            content=content,
+            headers={"content-type": content_type}
+        )
+        resume_id = response.json()["id"]
+        uploaded[body] = resume_id
+        return resume_id
+
+    return _make
+
+
+@pytest_asyncio.fixture(scope="class", params=list(SAMPLE_RESUMES))
+async def uploaded_resume_id(request, resume_factory):
+    """Upload a sample resume once per test class and return its ID"""
+    return await resume_factory(**SAMPLE_RESUMES[request.param])